@@ -1,23 +1,46 @@
+import os
+
 import click
 
 from boostrap import get_session
 from constants import DATABASE_URL, EMAIL_PASSWORD, EMAIL_SENDER
 from emails import Email
-from handlers import InMemoryReportHandler, SQLReportHandler
+from handlers import CentsReportHandler, InMemoryReportHandler, SQLReportHandler
 from models import GenerateReportCommand
 from notifications import EmailReportNotification
-from process import process_transaction_file
+from process import process_transaction_file, process_transaction_file_in_parallel
+
+IN_MEMORY_HANDLERS = {
+    "memory": InMemoryReportHandler,
+    "cents": CentsReportHandler,
+}
 
 
 @click.command()
 @click.argument("filepath", type=click.Path(exists=True))
 @click.argument("email", type=click.STRING)
-def send_report(filepath: str, email: str) -> None:
+@click.option(
+    "--handler",
+    "handler_name",
+    type=click.Choice(["sql", *IN_MEMORY_HANDLERS]),
+    help="Report handler, by default sql if DATABASE_URL is set or memory.",
+)
+@click.option(
+    "--workers",
+    default=os.cpu_count(),
+    type=click.IntRange(min=1),
+    help="Number of processes used by the in memory handlers.",
+)
+def send_report(
+    filepath: str, email: str, handler_name: str | None, workers: int
+) -> None:
     """Command to process a transaction file and send the report by email."""
     command = GenerateReportCommand(filepath=filepath, receiver_email=email)
     email = Email(EMAIL_SENDER, EMAIL_PASSWORD)
+    if handler_name is None:
+        handler_name = "sql" if DATABASE_URL else "memory"
 
-    if DATABASE_URL:
+    if handler_name == "sql":
         session = get_session()
         process_transaction_file(
             SQLReportHandler(session), EmailReportNotification(email), command
@@ -25,8 +48,11 @@ def send_report(filepath: str, email: str) -> None:
         session.commit()
         session.close()
     else:
-        process_transaction_file(
-            InMemoryReportHandler(), EmailReportNotification(email), command
+        process_transaction_file_in_parallel(
+            IN_MEMORY_HANDLERS[handler_name](),
+            EmailReportNotification(email),
+            command,
+            workers,
         )
 
     click.echo("Report sent!")
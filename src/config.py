@@ -0,0 +1,61 @@
+import os
+import threading
+import time
+from functools import cache
+
+SECRETS_TTL = float(os.getenv("SECRETS_TTL", "300"))
+
+
+@cache
+def get_client(service: str):
+    """Create the boto3 client of a service once per process.
+
+    boto3 is imported on first use, so code paths that never talk to AWS do not
+    pay for it.
+    """
+    import boto3
+
+    return boto3.client(service)
+
+
+class SSMParameters:
+    """Parameters stored in AWS SSM, fetched lazily and cached for ``ttl`` seconds.
+
+    ``names`` maps the key used by the application to the SSM parameter name,
+    every parameter is fetched with a single ``get_parameters`` call.
+    """
+
+    def __init__(self, names: dict[str, str], ttl: float = SECRETS_TTL, client=None):
+        self.names = names
+        self.ttl = ttl
+        self.client = client
+        self._values: dict[str, str] | None = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str:
+        """Get the value of a parameter."""
+        return self.values()[key]
+
+    def values(self) -> dict[str, str]:
+        """Get every parameter, fetching them again if the cache expired."""
+        with self._lock:
+            if self._values is None or time.monotonic() >= self._expires_at:
+                self._values = self._fetch()
+                self._expires_at = time.monotonic() + self.ttl
+            return self._values
+
+    def _fetch(self) -> dict[str, str]:
+        """Fetch every parameter from SSM."""
+        client = self.client or get_client("ssm")
+        response = client.get_parameters(
+            Names=list(set(self.names.values())), WithDecryption=True
+        )
+        if response.get("InvalidParameters"):
+            raise KeyError(f"Missing SSM parameters {response['InvalidParameters']}")
+
+        values = {
+            parameter["Name"]: parameter["Value"]
+            for parameter in response["Parameters"]
+        }
+        return {key: values[name] for key, name in self.names.items()}
@@ -3,3 +3,10 @@ import os
 DATABASE_URL = os.getenv("DATABASE_URL")
 EMAIL_SENDER = os.getenv("EMAIL_SENDER")
 EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
+LOAD_BATCH_SIZE = int(os.getenv("LOAD_BATCH_SIZE", "10000"))
+READ_CHUNK_SIZE = int(os.getenv("READ_CHUNK_SIZE", str(1024 * 1024)))
+SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "465"))
+SMTP_USE_SSL = os.getenv("SMTP_USE_SSL", "true").lower() == "true"
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "4"))
+SMTP_IDLE_TIMEOUT = float(os.getenv("SMTP_IDLE_TIMEOUT", "60"))
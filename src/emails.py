@@ -1,33 +1,177 @@
 import smtplib
 import ssl
+import threading
+import time
+from contextlib import contextmanager
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from typing import Iterable, Iterator
+
+from constants import (
+    SMTP_HOST,
+    SMTP_IDLE_TIMEOUT,
+    SMTP_POOL_SIZE,
+    SMTP_PORT,
+    SMTP_USE_SSL,
+)
+
+
+class SMTPConnectionPool:
+    """Pool of logged in SMTP connections reused between messages.
+
+    Connections idle for more than ``idle_timeout`` seconds are closed, the
+    ones idle for more than ``health_check_after`` seconds are checked with a
+    NOOP before being reused.
+    """
+
+    def __init__(
+        self,
+        sender: str,
+        password: str | None,
+        host: str = SMTP_HOST,
+        port: int = SMTP_PORT,
+        use_ssl: bool = SMTP_USE_SSL,
+        max_size: int = SMTP_POOL_SIZE,
+        idle_timeout: float = SMTP_IDLE_TIMEOUT,
+        health_check_after: float = 5,
+    ) -> None:
+        self.sender = sender
+        self.password = password
+        self.host = host
+        self.port = port
+        self.use_ssl = use_ssl
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self.n_connections_opened = 0
+        self._idle_connections: list[tuple[smtplib.SMTP, float]] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """Borrow a connection, it is returned to the pool if nothing failed."""
+        with self._slots:
+            connection = self._checkout()
+            try:
+                yield connection
+            except BaseException:
+                self._quit(connection)
+                raise
+            with self._lock:
+                self._idle_connections.append((connection, time.monotonic()))
+
+    def send_many(self, messages: Iterable[tuple[list[str], str]]) -> None:
+        """Send ``(receivers, message)`` pairs over a single session.
+
+        If the server drops the session, the pending message is sent again once
+        using another connection.
+        """
+        messages = iter(messages)
+        message = next(messages, None)
+        retried = False
+        while message is not None:
+            try:
+                with self.connection() as connection:
+                    while message is not None:
+                        receivers, content = message
+                        connection.sendmail(self.sender, receivers, content)
+                        message = next(messages, None)
+                        retried = False
+            except smtplib.SMTPServerDisconnected:
+                if retried:
+                    raise
+                retried = True
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle_connections, self._idle_connections = self._idle_connections, []
+        for connection, _ in idle_connections:
+            self._quit(connection)
+
+    def _checkout(self) -> smtplib.SMTP:
+        """Take a healthy idle connection or open a new one."""
+        while True:
+            with self._lock:
+                if not self._idle_connections:
+                    break
+                connection, last_used = self._idle_connections.pop()
+
+            idle_time = time.monotonic() - last_used
+            if idle_time > self.idle_timeout:
+                self._quit(connection)
+            elif idle_time > self.health_check_after and not self._is_alive(connection):
+                self._quit(connection)
+            else:
+                return connection
+        return self._connect()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open a new connection and log in."""
+        if self.use_ssl:
+            context = ssl.create_default_context()
+            connection = smtplib.SMTP_SSL(self.host, self.port, context=context)
+        else:
+            connection = smtplib.SMTP(self.host, self.port)
+        if self.password:
+            connection.login(self.sender, self.password)
+        self.n_connections_opened += 1
+        return connection
+
+    @staticmethod
+    def _is_alive(connection: smtplib.SMTP) -> bool:
+        """Check that the server still answers on the connection."""
+        try:
+            return connection.noop()[0] == 250
+        except smtplib.SMTPException:
+            return False
+
+    @staticmethod
+    def _quit(connection: smtplib.SMTP) -> None:
+        """Close a connection, ignoring a server that is already gone."""
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
 
 
 class Email:
-    """Class to send emails using Gmail SMTP server."""
+    """Class to send emails through a pool of SMTP connections."""
 
-    def __init__(self, sender: str, password: str) -> None:
+    def __init__(
+        self,
+        sender: str,
+        password: str,
+        host: str = SMTP_HOST,
+        port: int = SMTP_PORT,
+        use_ssl: bool = SMTP_USE_SSL,
+        pool: SMTPConnectionPool | None = None,
+    ) -> None:
         """Initialize the Email class."""
         self.sender = sender
         self.password = password
+        self.pool = pool or SMTPConnectionPool(
+            sender, password, host=host, port=port, use_ssl=use_ssl
+        )
 
     def send(self, subject: str, body: str, receivers: list[str]) -> None:
         """Send an email to the specified receivers."""
+        self.send_many([(subject, body, receivers)])
+
+    def send_many(self, emails: Iterable[tuple[str, str, list[str]]]) -> None:
+        """Send several ``(subject, body, receivers)`` emails in one session."""
+        self.pool.send_many(
+            (receivers, self.__build_message(subject, body, receivers).as_string())
+            for subject, body, receivers in emails
+        )
+
+    def __build_message(
+        self, subject: str, body: str, receivers: list[str]
+    ) -> MIMEMultipart:
+        """Helper method to build the email message."""
         msg = MIMEMultipart()
         msg["From"] = self.sender
         msg["To"] = ", ".join(receivers)
         msg["Subject"] = subject
         msg.attach(MIMEText(body.encode("utf-8"), "html", "utf-8"))
-
-        Email.__send(msg, self.sender, self.password, receivers)
-
-    @staticmethod
-    def __send(
-        message: MIMEMultipart, sender_email: str, password: str, receivers: list[str]
-    ) -> None:
-        """Helper method use Gmail to send the email."""
-        context = ssl.create_default_context()
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465, context=context) as server:
-            server.login(sender_email, password)
-            server.sendmail(sender_email, receivers, message.as_string())
+        return msg
@@ -1,13 +1,20 @@
 import calendar
+import io
 from abc import ABC, abstractmethod
+from array import array
 from collections import defaultdict
 from decimal import Decimal
 
-from sqlalchemy import text
+from constants import LOAD_BATCH_SIZE
+from models import (
+    ReportInformationPerMonth,
+    ReportResult,
+    Transaction,
+    TransactionBatch,
+)
+from parsers import cents_to_decimal, iter_transactions
 
-from commands.create_tx_file import Transaction
-from db import Transaction as TransactionModel
-from models import ReportInformationPerMonth, ReportResult
+TWO_DECIMAL_PLACES = Decimal("0.01")
 
 
 class ReportHandler(ABC):
@@ -21,6 +28,14 @@ class ReportHandler(ABC):
     def calculate(self, file_id: str) -> ReportResult:
         """Calculate the report."""
 
+    def load_batch(self, batch: TransactionBatch, file_id: str):
+        """Load a batch of parsed transactions into the handler."""
+        for transaction in iter_transactions(batch):
+            self.load(transaction, file_id)
+
+    def finish(self, file_id: str):
+        """Signal that every transaction of the file has been loaded."""
+
     def _safe_division(self, a: Decimal, b: Decimal) -> Decimal:
         """Safely divide two numbers."""
         if b == 0:
@@ -29,7 +44,7 @@ class ReportHandler(ABC):
 
     def _two_decimal_round(self, value: Decimal) -> Decimal:
         """Round a number to two decimal places."""
-        return Decimal(value).quantize(Decimal("0.01"))
+        return Decimal(value).quantize(TWO_DECIMAL_PLACES)
 
 
 class InMemoryReportHandler(ReportHandler):
@@ -51,6 +66,51 @@ class InMemoryReportHandler(ReportHandler):
             self.result[month_name]["n_debit_transactions"] += 1
             self.result[month_name]["sum_debit"] += transaction.amount
 
+    def to_partial(self) -> dict[str, dict[str, Decimal | int]]:
+        """Return the loaded totals as a picklable partial aggregate."""
+        return {month: dict(totals) for month, totals in self.result.items()}
+
+    def merge(self, partial: dict[str, dict[str, Decimal | int]]):
+        """Add the partial aggregate of another handler to this handler."""
+        for month, totals in partial.items():
+            month_result = self.result[month]
+            for key, value in totals.items():
+                month_result[key] += value
+
+    def load_batch(self, batch: TransactionBatch, file_id: str):
+        """Load a batch of parsed transactions into the handler.
+
+        The batch is aggregated in cents first, so only one Decimal is built
+        per month and transaction type.
+        """
+        totals_per_month: dict[int, list[int]] = {}
+        for month, amount, is_credit in zip(
+            batch.months, batch.amounts, batch.is_credit
+        ):
+            totals = totals_per_month.get(month)
+            if totals is None:
+                totals = totals_per_month[month] = [0, 0, 0, 0]
+            if is_credit:
+                totals[0] += 1
+                totals[1] += amount
+            else:
+                totals[2] += 1
+                totals[3] += amount
+
+        for month, (
+            n_credit,
+            sum_credit,
+            n_debit,
+            sum_debit,
+        ) in totals_per_month.items():
+            month_result = self.result[calendar.month_name[month]]
+            if n_credit:
+                month_result["n_credit_transactions"] += n_credit
+                month_result["sum_credit"] += cents_to_decimal(sum_credit, batch.scale)
+            if n_debit:
+                month_result["n_debit_transactions"] += n_debit
+                month_result["sum_debit"] += cents_to_decimal(sum_debit, batch.scale)
+
     def calculate(self, file_id: str) -> ReportResult:
         """Calculate the report."""
         information_per_month: list[ReportInformationPerMonth] = []
@@ -98,28 +158,207 @@ class InMemoryReportHandler(ReportHandler):
         )
 
 
+class CentsReportHandler(ReportHandler):
+    """In memory report handler using integer cents.
+
+    Counters live in a fixed 12x4 array indexed by month number and amounts
+    are only converted to Decimal when the report is calculated.
+    """
+
+    N_CREDIT, SUM_CREDIT, N_DEBIT, SUM_DEBIT = range(4)
+
+    def __init__(self):
+        """Initialize the handler."""
+        self.totals = array("q", bytes(array("q").itemsize * 12 * 4))
+        self.months: list[int] = []
+        self.scale = 0
+
+    def load(self, transaction: Transaction, file_id: str):
+        """Load a transaction into the handler."""
+        month = transaction.date.month
+        self._add_month(month)
+
+        decimal_places = max(0, -transaction.amount.as_tuple().exponent)
+        if decimal_places > 2:
+            raise ValueError(f"Amount {transaction.amount} has more than two decimals")
+        self.scale = max(self.scale, decimal_places)
+
+        index = (month - 1) * 4
+        index += self.N_CREDIT if transaction.is_credit else self.N_DEBIT
+        self.totals[index] += 1
+        self.totals[index + 1] += int(transaction.amount * 100)
+
+    def load_batch(self, batch: TransactionBatch, file_id: str):
+        """Load a batch of parsed transactions into the handler."""
+        for month in dict.fromkeys(batch.months):
+            self._add_month(month)
+        self.scale = max(self.scale, batch.scale)
+
+        # Accumulating in a list is cheaper than updating the array per row.
+        totals = [0] * len(self.totals)
+        credit_offset, debit_offset = self.N_CREDIT, self.N_DEBIT
+        for month, amount, is_credit in zip(
+            batch.months, batch.amounts, batch.is_credit
+        ):
+            index = (month - 1) * 4 + (credit_offset if is_credit else debit_offset)
+            totals[index] += 1
+            totals[index + 1] += amount
+
+        for index, value in enumerate(totals):
+            self.totals[index] += value
+
+    def to_partial(self) -> tuple[array, list[int], int]:
+        """Return the loaded totals as a picklable partial aggregate."""
+        return self.totals, self.months, self.scale
+
+    def merge(self, partial: tuple[array, list[int], int]):
+        """Add the partial aggregate of another handler to this handler."""
+        totals, months, scale = partial
+        for index, value in enumerate(totals):
+            self.totals[index] += value
+        for month in months:
+            self._add_month(month)
+        self.scale = max(self.scale, scale)
+
+    def _add_month(self, month: int):
+        """Keep track of the order in which months appear."""
+        if month not in self.months:
+            self.months.append(month)
+
+    def calculate(self, file_id: str) -> ReportResult:
+        """Calculate the report."""
+        information_per_month: list[ReportInformationPerMonth] = []
+        for month in self.months:
+            index = (month - 1) * 4
+            (
+                n_credit_transactions,
+                sum_credit,
+                n_debit_transactions,
+                sum_debit,
+            ) = self.totals[index : index + 4]
+
+            average_credit_per_month = self._two_decimal_round(
+                self._safe_division(
+                    cents_to_decimal(sum_credit, self.scale), n_credit_transactions
+                )
+            )
+            average_debit_per_month = self._two_decimal_round(
+                self._safe_division(
+                    cents_to_decimal(sum_debit, self.scale), n_debit_transactions
+                )
+            )
+            information_per_month.append(
+                ReportInformationPerMonth(
+                    month=calendar.month_name[month],
+                    average_credit=average_credit_per_month,
+                    average_debit=average_debit_per_month,
+                    n_transactions=n_credit_transactions + n_debit_transactions,
+                )
+            )
+
+        total_credit_transactions = sum(self.totals[self.N_CREDIT :: 4])
+        total_debit_transactions = sum(self.totals[self.N_DEBIT :: 4])
+        total_credit_amount = cents_to_decimal(
+            sum(self.totals[self.SUM_CREDIT :: 4]), self.scale
+        )
+        total_debit_amount = cents_to_decimal(
+            sum(self.totals[self.SUM_DEBIT :: 4]), self.scale
+        )
+
+        average_credit = self._two_decimal_round(
+            self._safe_division(total_credit_amount, total_credit_transactions)
+        )
+        average_debit = self._two_decimal_round(
+            self._safe_division(total_debit_amount, total_debit_transactions)
+        )
+        return ReportResult(
+            balance=total_credit_amount - total_debit_amount,
+            average_credit=average_credit,
+            average_debit=average_debit,
+            information_per_month=information_per_month,
+        )
+
+
 class SQLReportHandler(ReportHandler):
-    """SQL report handler."""
+    """SQL report handler.
+
+    Transactions are buffered and written in batches of ``batch_size`` rows,
+    using ``COPY FROM STDIN`` on PostgreSQL and an executemany insert on any
+    other database. SQLAlchemy is imported on first use, so the in memory
+    handlers do not pay for it.
+    """
 
-    def __init__(self, session):
+    COPY_QUERY = (
+        "COPY transactions (tx_id, amount, date, is_credit, file_id) "
+        "FROM STDIN WITH (FORMAT csv)"
+    )
+
+    def __init__(self, session, batch_size: int = LOAD_BATCH_SIZE):
         """Initialize the handler."""
         self.session = session
+        self.batch_size = batch_size
+        self.pending: list[tuple[Transaction, str]] = []
 
     def load(self, transaction: Transaction, file_id: str):
         """Load a transaction into the handler."""
-        self.session.add(
-            TransactionModel(
-                tx_id=transaction.id,
-                date=transaction.date,
-                amount=transaction.amount,
-                is_credit=transaction.is_credit,
-                file_id=file_id,
+        self.pending.append((transaction, file_id))
+        if len(self.pending) >= self.batch_size:
+            self._flush_pending()
+
+    def finish(self, file_id: str):
+        """Write the transactions that are still buffered."""
+        self._flush_pending()
+
+    def _flush_pending(self):
+        """Write the buffered transactions to the database."""
+        if not self.pending:
+            return
+
+        if self.session.get_bind().dialect.name == "postgresql":
+            self._copy_pending()
+        else:
+            self._insert_pending()
+        self.pending = []
+
+    def _copy_pending(self):
+        """Stream the buffered transactions using PostgreSQL COPY."""
+        buffer = io.StringIO()
+        for transaction, file_id in self.pending:
+            buffer.write(
+                f"{transaction.id},{transaction.amount},"
+                f"{transaction.date:%Y-%m-%d},{transaction.is_credit},{file_id}\n"
             )
+        buffer.seek(0)
+
+        connection = self.session.connection().connection
+        with connection.cursor() as cursor:
+            cursor.copy_expert(self.COPY_QUERY, buffer)
+
+    def _insert_pending(self):
+        """Insert the buffered transactions with a single executemany."""
+        from sqlalchemy import insert
+
+        from db import Transaction as TransactionModel
+
+        self.session.execute(
+            insert(TransactionModel),
+            [
+                {
+                    "tx_id": transaction.id,
+                    "date": transaction.date,
+                    "amount": transaction.amount,
+                    "is_credit": transaction.is_credit,
+                    "file_id": file_id,
+                }
+                for transaction, file_id in self.pending
+            ],
         )
-        self.session.flush()
 
     def calculate(self, file_id: str) -> ReportResult:
         """Calculate the report."""
+        from sqlalchemy import text
+
+        self._flush_pending()
 
         calculate_query = """
         SELECT date_trunc('month', date) as month,
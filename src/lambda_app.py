@@ -1,61 +1,91 @@
 import logging
 import os
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-import boto3
-
+from config import SSMParameters, get_client
 from emails import Email
 from handlers import InMemoryReportHandler
 from models import GenerateReportCommand
 from notifications import EmailReportNotification
 from process import process_transaction_file
+from readers import S3Reader
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
-s3 = boto3.client("s3")
-ssm = boto3.client("ssm")
 
 EMAIL_RECEIVER = os.getenv("EMAIL_RECEIVER")
+MAX_WORKERS = int(os.getenv("MAX_WORKERS", "4"))
 
-
-def _get_ssm_parameter(name: str) -> str:
-    """Get a parameter from AWS SSM."""
-    return ssm.get_parameter(Name=name, WithDecryption=True)["Parameter"]["Value"]
-
-
-EMAIL_PASSWORD = _get_ssm_parameter(os.getenv("EMAIL_PASSWORD"))
-EMAIL_SENDER = _get_ssm_parameter(os.getenv("EMAIL_SENDER"))
+secrets = SSMParameters(
+    {
+        "EMAIL_SENDER": os.getenv("EMAIL_SENDER"),
+        "EMAIL_PASSWORD": os.getenv("EMAIL_PASSWORD"),
+    }
+)
 
 
 def lambda_handler(event, context):
     """Lambda handler react to S3 events.
 
-    Download the file from S3, process it and send the report by email.
+    Every record of the event is processed concurrently, records that fail are
+    reported back as batch item failures.
     """
+    records = event["Records"]
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_WORKERS, len(records)))
+    ) as executor:
+        results = list(executor.map(_process_record_safely, records))
 
-    bucket = event["Records"][0]["s3"]["bucket"]["name"]
-    key = urllib.parse.unquote_plus(
-        event["Records"][0]["s3"]["object"]["key"], encoding="utf-8"
-    )
-    local_path = "/tmp/file.csv"
-    try:
-        s3.download_file(bucket, key, local_path)
+    batch_item_failures = [
+        {"itemIdentifier": identifier}
+        for identifier, succeeded in results
+        if not succeeded
+    ]
+    if batch_item_failures:
+        message = f"{len(batch_item_failures)} of {len(records)} reports failed!"
+    else:
+        message = "Report sent!" if len(records) == 1 else "Reports sent!"
+    return {"message": message, "batchItemFailures": batch_item_failures}
 
-        command = GenerateReportCommand(
-            filepath=local_path, receiver_email=EMAIL_RECEIVER
-        )
-        process_transaction_file(
-            InMemoryReportHandler(),
-            EmailReportNotification(Email(EMAIL_SENDER, EMAIL_PASSWORD)),
-            command,
-        )
 
+def _process_record_safely(record) -> tuple[str, bool]:
+    """Process a record and tell whether it succeeded."""
+    bucket = record["s3"]["bucket"]["name"]
+    key = urllib.parse.unquote_plus(record["s3"]["object"]["key"], encoding="utf-8")
+    try:
+        process_record(bucket, key)
     except Exception as e:
         logger.error(e)
         logger.error(
             f"Error getting object {key} from bucket {bucket}. Make sure they "
             "exist and your bucket is in the same region as this function."
         )
-        raise e
+        return f"{bucket}/{key}", False
+    return f"{bucket}/{key}", True
+
+
+def process_record(bucket: str, key: str) -> None:
+    """Stream a file from S3 while processing it and send the report by email."""
+    command = GenerateReportCommand(
+        filepath=f"s3://{bucket}/{key}", receiver_email=EMAIL_RECEIVER
+    )
+    process_transaction_file(
+        InMemoryReportHandler(),
+        EmailReportNotification(get_email()),
+        command,
+        reader=S3Reader(get_client("s3"), bucket, key),
+    )
+
+
+def get_email() -> Email:
+    """Get the email service, it is only built again when the secrets change."""
+    values = secrets.values()
+    return _build_email(values["EMAIL_SENDER"], values["EMAIL_PASSWORD"])
+
 
-    return {"message": "Report sent!"}
+@lru_cache(maxsize=1)
+def _build_email(sender: str, password: str) -> Email:
+    """Build the email service."""
+    return Email(sender, password)
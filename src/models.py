@@ -15,6 +15,10 @@ ReportResult = namedtuple(
     ["balance", "average_credit", "average_debit", "information_per_month"],
 )
 
+TransactionBatch = namedtuple(
+    "TransactionBatch", ["ids", "months", "days", "amounts", "is_credit", "scale"]
+)
+
 
 class Transaction(namedtuple("Transaction", ["id", "date", "amount", "is_credit"])):
     __slots__ = ()
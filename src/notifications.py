@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from functools import cache
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
@@ -6,6 +7,15 @@ from emails import Email
 from handlers import ReportResult
 
 
+@cache
+def get_environment() -> Environment:
+    """Create the template environment once per process."""
+    return Environment(
+        loader=FileSystemLoader(["./templates", "./src/templates"]),
+        autoescape=select_autoescape(),
+    )
+
+
 class Notification(ABC):
     """Abstract class to send notifications."""
 
@@ -28,11 +38,7 @@ class EmailReportNotification(Notification):
 
     def __render_template(self, report_result: ReportResult) -> str:
         """Render the email template."""
-        env = Environment(
-            loader=FileSystemLoader(["./templates", "./src/templates"]),
-            autoescape=select_autoescape(),
-        )
-        template = env.get_template("report.html")
+        template = get_environment().get_template("report.html")
         return template.render(**self.__generate_email_body_kwargs(report_result))
 
     def __generate_email_body_kwargs(
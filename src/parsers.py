@@ -0,0 +1,79 @@
+import datetime
+from array import array
+from decimal import Decimal
+
+from models import Transaction, TransactionBatch
+
+# Every "MM/DD" string of a leap year mapped to its (month, day) numbers.
+DATE_TABLE: dict[bytes, tuple[int, int]] = {
+    f"{date:%m/%d}".encode(): (date.month, date.day)
+    for date in (
+        datetime.date(2024, 1, 1) + datetime.timedelta(days=n) for n in range(366)
+    )
+}
+
+
+def parse_batch(chunk: bytes | memoryview) -> TransactionBatch:
+    """Parse a chunk of whole CSV lines (without header) into columns.
+
+    Amounts are stored as integer cents and ``scale`` keeps the largest number
+    of decimal places found, so the original ``Decimal`` values can be rebuilt.
+    """
+    # Splitting on whitespace drops blank lines, "\r" and the trailing newline.
+    # bytes() returns the same object for bytes and copies a memoryview once.
+    lines = bytes(chunk).split()
+    fields = b",".join(lines).split(b",") if lines else []
+    if len(fields) != 3 * len(lines):
+        raise ValueError("Every transaction line must have 3 fields")
+
+    ids = array("q", map(int, fields[0::3]))
+    months = array("b")
+    days = array("b")
+    for date in fields[1::3]:
+        month, day = DATE_TABLE.get(date) or _parse_date(date)
+        months.append(month)
+        days.append(day)
+
+    amounts = array("q")
+    is_credit = array("b")
+    scale = 0
+    for amount in fields[2::3]:
+        integer, _, fraction = amount[1:].partition(b".")
+        if len(fraction) > 2:
+            raise ValueError(f"Amount {amount!r} has more than two decimals")
+        scale = max(scale, len(fraction))
+        amounts.append(int(integer or b"0") * 100 + int(fraction.ljust(2, b"0")))
+        is_credit.append(amount[:1] == b"+")
+
+    return TransactionBatch(
+        ids=ids,
+        months=months,
+        days=days,
+        amounts=amounts,
+        is_credit=is_credit,
+        scale=scale,
+    )
+
+
+def cents_to_decimal(cents: int, scale: int) -> Decimal:
+    """Convert an amount in cents to a Decimal with ``scale`` decimal places."""
+    return Decimal(cents // 10 ** (2 - scale)).scaleb(-scale)
+
+
+def iter_transactions(batch: TransactionBatch):
+    """Yield every row of a batch as a Transaction."""
+    for id, month, day, amount, is_credit in zip(
+        batch.ids, batch.months, batch.days, batch.amounts, batch.is_credit
+    ):
+        yield Transaction(
+            id=id,
+            date=datetime.datetime(1900, month, day),
+            amount=cents_to_decimal(amount, batch.scale),
+            is_credit=bool(is_credit),
+        )
+
+
+def _parse_date(date: bytes) -> tuple[int, int]:
+    """Parse a date that is not zero padded, like "1/5"."""
+    parsed_date = datetime.datetime.strptime(date.decode(), "%m/%d")
+    return parsed_date.month, parsed_date.day
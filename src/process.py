@@ -1,33 +1,98 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Generator
 from uuid import uuid4
 
-from handlers import ReportHandler
-from models import GenerateReportCommand, Transaction
+from handlers import CentsReportHandler, InMemoryReportHandler, ReportHandler
+from models import GenerateReportCommand
 from notifications import Notification
+from readers import FileReader, TransactionReader, split_file
 
 
 def read_transaction_file(filepath: str) -> Generator[str, None, None]:
-    """Read a transaction file and yield each line."""
-    with open(filepath, "r") as file:
-        file.readline()  # skip header
-        for line in file.readlines():
-            yield line
+    """Read a transaction file and yield each non blank line."""
+    for chunk in FileReader(filepath):
+        for line in chunk.decode().splitlines(keepends=True):
+            if line.strip():
+                yield line
 
 
 def process_transaction_file(
     report_handler: ReportHandler,
     notification_service: Notification,
     command: GenerateReportCommand,
+    reader: TransactionReader | None = None,
 ) -> None:
-    """Process a transaction file and send a report notification."""
+    """Process a transaction file and send a report notification.
+
+    The file is read from ``command.filepath`` unless another reader is given.
+    """
     file_id = uuid4()
+    if reader is None:
+        reader = FileReader(command.filepath)
     # Load transactions
-    for line in read_transaction_file(command.filepath):
-        transaction = Transaction.from_csv(line)
-        report_handler.load(transaction, file_id)
+    for batch in reader.batches():
+        report_handler.load_batch(batch, file_id)
+    report_handler.finish(file_id)
 
     # Calculate report
     report_result = report_handler.calculate(file_id)
 
     # Send notification
     notification_service.send(report_result, [command.receiver_email])
+
+
+def process_transaction_file_in_parallel(
+    report_handler: InMemoryReportHandler | CentsReportHandler,
+    notification_service: Notification,
+    command: GenerateReportCommand,
+    workers: int,
+) -> None:
+    """Process a transaction file using several processes.
+
+    The file is split in byte ranges, every worker aggregates one range with a
+    handler of the same class and the partial aggregates are merged in order.
+    """
+    file_id = uuid4()
+    handler_class = type(report_handler)
+    ranges = split_file(command.filepath, workers)
+    # Load transactions
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        report_handler.merge(
+            _load_file_range(handler_class, command.filepath, start, end, file_id)
+        )
+    else:
+        starts, ends = zip(*ranges)
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            partials = executor.map(
+                _load_file_range,
+                repeat(handler_class),
+                repeat(command.filepath),
+                starts,
+                ends,
+                repeat(file_id),
+            )
+            for partial in partials:
+                report_handler.merge(partial)
+    report_handler.finish(file_id)
+
+    # Calculate report
+    report_result = report_handler.calculate(file_id)
+
+    # Send notification
+    notification_service.send(report_result, [command.receiver_email])
+
+
+def _load_file_range(
+    handler_class: type[InMemoryReportHandler | CentsReportHandler],
+    filepath: str,
+    start: int,
+    end: int,
+    file_id: str,
+):
+    """Aggregate a byte range of a transaction file in a worker process."""
+    report_handler = handler_class()
+    for batch in FileReader(filepath, start=start, end=end).batches():
+        report_handler.load_batch(batch, file_id)
+    return report_handler.to_partial()
@@ -0,0 +1,241 @@
+import mmap
+import os
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import Generator, Iterable, Iterator
+
+from constants import READ_CHUNK_SIZE
+from models import TransactionBatch
+from parsers import parse_batch
+
+
+class TransactionReader(ABC):
+    """Abstract class to read a transaction file as chunks of whole lines.
+
+    ``bytes_processed`` counts the bytes of the input (header included) that
+    have been handed out in chunks so far.
+    """
+
+    def __init__(self, skip_header: bool = True) -> None:
+        self.skip_header = skip_header
+        self.bytes_processed = 0
+
+    @abstractmethod
+    def read_buffers(self) -> Iterator[bytes]:
+        """Yield the raw content of the input in buffers of any size."""
+
+    def __iter__(self) -> Generator[bytes, None, None]:
+        """Yield chunks of whole lines, skipping the header.
+
+        A line split between two buffers is carried over to the next chunk,
+        so memory is bounded by the buffer size plus the longest line.
+        """
+        self.bytes_processed = 0
+        is_header = self.skip_header
+        remainder = b""
+        for buffer in self.read_buffers():
+            data = remainder + buffer if remainder else buffer
+            if is_header:
+                header_end = data.find(b"\n")
+                if header_end == -1:
+                    remainder = data
+                    continue
+                is_header = False
+                self.bytes_processed += header_end + 1
+                data = data[header_end + 1 :]
+
+            last_line_end = data.rfind(b"\n")
+            if last_line_end == -1:
+                remainder = data
+                continue
+            remainder = data[last_line_end + 1 :]
+            self.bytes_processed += last_line_end + 1
+            yield data[: last_line_end + 1]
+
+        if remainder and not is_header:
+            # The last line has no trailing newline.
+            self.bytes_processed += len(remainder)
+            yield remainder
+
+    def batches(self) -> Generator[TransactionBatch, None, None]:
+        """Yield every chunk of the input parsed as a batch."""
+        for chunk in self:
+            yield parse_batch(chunk)
+
+
+class FileReader(TransactionReader):
+    """Read a transaction file from disk in fixed size buffers.
+
+    ``start`` and ``end`` limit the reader to a byte range of the file, only the
+    range starting at the beginning of the file contains the header.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        buffer_size: int = READ_CHUNK_SIZE,
+        start: int = 0,
+        end: int | None = None,
+    ) -> None:
+        super().__init__(skip_header=start == 0)
+        self.filepath = filepath
+        self.buffer_size = buffer_size
+        self.start = start
+        self.end = end
+
+    def read_buffers(self) -> Generator[bytes, None, None]:
+        """Yield the file content in buffers of ``buffer_size`` bytes."""
+        with open(self.filepath, "rb") as file:
+            file.seek(self.start)
+            if self.end is None:
+                while buffer := file.read(self.buffer_size):
+                    yield buffer
+                return
+
+            remaining = self.end - self.start
+            while remaining > 0 and (
+                buffer := file.read(min(self.buffer_size, remaining))
+            ):
+                remaining -= len(buffer)
+                yield buffer
+
+
+class MmapFileReader(TransactionReader):
+    """Read a transaction file from disk through a memory map.
+
+    Chunks are memoryview slices of the map cut on line boundaries, so the
+    content is never decoded nor copied by the reader. The map is released once
+    the last chunk is garbage collected.
+    """
+
+    def __init__(self, filepath: str, chunk_size: int = READ_CHUNK_SIZE) -> None:
+        super().__init__()
+        self.filepath = filepath
+        self.chunk_size = chunk_size
+
+    def _map_file(self) -> memoryview:
+        """Map the whole file in memory."""
+        if os.path.getsize(self.filepath) == 0:
+            return memoryview(b"")
+        with open(self.filepath, "rb") as file:
+            return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def read_buffers(self) -> Generator[memoryview, None, None]:
+        """Yield the file content in slices of ``chunk_size`` bytes."""
+        view = self._map_file()
+        for start in range(0, len(view), self.chunk_size):
+            yield view[start : start + self.chunk_size]
+
+    def __iter__(self) -> Generator[memoryview, None, None]:
+        """Yield slices of whole lines, skipping the header."""
+        view = self._map_file()
+        mapped = view.obj
+        size = len(view)
+
+        self.bytes_processed = start = mapped.find(b"\n") + 1
+        if start == 0:
+            return
+
+        while start < size:
+            end = start + self.chunk_size
+            if end < size:
+                line_end = mapped.find(b"\n", end - 1)
+                end = size if line_end == -1 else line_end + 1
+            else:
+                end = size
+            self.bytes_processed = end
+            yield view[start:end]
+            start = end
+
+
+class S3Reader(TransactionReader):
+    """Read a transaction file straight from an S3 object body.
+
+    Chunks of the body are downloaded by a background thread while the
+    previous ones are parsed, keeping up to ``prefetch`` chunks in memory.
+    """
+
+    def __init__(
+        self,
+        client,
+        bucket: str,
+        key: str,
+        chunk_size: int = READ_CHUNK_SIZE,
+        prefetch: int = 4,
+    ) -> None:
+        super().__init__()
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.chunk_size = chunk_size
+        self.prefetch = prefetch
+
+    def read_buffers(self) -> Generator[bytes, None, None]:
+        """Yield the object body in chunks while the next ones are downloaded."""
+        body = self.client.get_object(Bucket=self.bucket, Key=self.key)["Body"]
+        try:
+            yield from prefetch(body.iter_chunks(self.chunk_size), self.prefetch)
+        finally:
+            body.close()
+
+
+def prefetch(buffers: Iterable[bytes], size: int) -> Generator[bytes, None, None]:
+    """Consume ``buffers`` in a background thread, up to ``size`` ahead."""
+    buffer_queue: queue.Queue = queue.Queue(maxsize=size)
+    stopped = threading.Event()
+    end_of_buffers = object()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for buffer in buffers:
+                if not put(buffer):
+                    return
+        except Exception as error:
+            put(error)
+        else:
+            put(end_of_buffers)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while (item := buffer_queue.get()) is not end_of_buffers:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+        producer.join()
+
+
+def split_file(
+    filepath: str, n_parts: int, min_part_size: int = READ_CHUNK_SIZE
+) -> list[tuple[int, int]]:
+    """Split a file in up to ``n_parts`` byte ranges aligned on line boundaries.
+
+    Small files get fewer parts, so each part has at least ``min_part_size``
+    bytes.
+    """
+    file_size = os.path.getsize(filepath)
+    n_parts = max(1, min(n_parts, file_size // max(1, min_part_size)))
+
+    boundaries = [0]
+    with open(filepath, "rb") as file:
+        for part in range(1, n_parts):
+            file.seek(max(file_size * part // n_parts, boundaries[-1]))
+            file.readline()  # move to the beginning of the next line
+            boundaries.append(file.tell())
+    boundaries.append(file_size)
+    ranges = [
+        (start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end
+    ]
+    return ranges or [(0, file_size)]
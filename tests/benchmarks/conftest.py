@@ -0,0 +1,14 @@
+import os
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmarks unless the RUN_BENCHMARKS variable is set."""
+    if os.getenv("RUN_BENCHMARKS"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="Set RUN_BENCHMARKS=1 to run it")
+    for item in items:
+        if "benchmarks" in item.nodeid:
+            item.add_marker(skip_benchmark)
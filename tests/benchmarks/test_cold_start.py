@@ -0,0 +1,34 @@
+import os
+import re
+import subprocess
+import sys
+
+# Importing lambda_app eagerly (boto3, SQLAlchemy and two SSM calls) took
+# more than 800ms, keep a budget well below it to catch regressions.
+IMPORT_TIME_BUDGET_MS = 300
+
+
+def measure_import_time_ms(module: str) -> float:
+    """Cumulative import time of a module as reported by -X importtime."""
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    match = re.search(
+        rf"^import time:\s+\d+ \|\s+(\d+) \| {module}$",
+        completed_process.stderr,
+        re.MULTILINE,
+    )
+    return int(match.group(1)) / 1000
+
+
+def test__import__lambda_app_cold_start():
+    # Act
+    import_time_ms = min(measure_import_time_ms("lambda_app") for _ in range(3))
+
+    # Assert
+    print(f"\nlambda_app import time: {import_time_ms:.1f}ms")
+    assert import_time_ms < IMPORT_TIME_BUDGET_MS
@@ -0,0 +1,51 @@
+import time
+import uuid
+
+import pytest
+
+from handlers import CentsReportHandler, InMemoryReportHandler
+from parsers import iter_transactions, parse_batch
+
+N_ROWS = 1_000_000
+BATCH_SIZE = 10_000
+
+
+@pytest.fixture(scope="module")
+def batches():
+    chunk = "".join(
+        f"{i},{i % 12 + 1:02d}/{i % 28 + 1:02d},{'+' if i % 2 else '-'}{i % 200}.5\n"
+        for i in range(BATCH_SIZE)
+    ).encode()
+    return [parse_batch(chunk)] * (N_ROWS // BATCH_SIZE)
+
+
+def load_batches(handler, batches, file_id):
+    for batch in batches:
+        handler.load_batch(batch, file_id)
+
+
+def load_transactions(handler, batches, file_id):
+    for batch in batches:
+        for transaction in iter_transactions(batch):
+            handler.load(transaction, file_id)
+
+
+@pytest.mark.parametrize("load", [load_batches, load_transactions])
+def test__handlers__rows_per_second(batches, load):
+    # Arrange
+    results = {}
+
+    # Act
+    for handler_class in (InMemoryReportHandler, CentsReportHandler):
+        handler = handler_class()
+        file_id = uuid.uuid4()
+        start = time.perf_counter()
+        load(handler, batches, file_id)
+        result = handler.calculate(file_id)
+        rows_per_second = N_ROWS / (time.perf_counter() - start)
+        results[handler_class.__name__] = result
+        print(f"\n{load.__name__} {handler_class.__name__}: {rows_per_second:,.0f}")
+
+    # Assert
+    in_memory_result, cents_result = results.values()
+    assert repr(cents_result) == repr(in_memory_result)
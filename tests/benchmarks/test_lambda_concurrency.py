@@ -0,0 +1,33 @@
+import time
+
+from tests.fakes import build_s3_event
+
+N_RECORDS = 16
+S3_LATENCY = 0.1
+TX_FILE = b"Id,Date,Transaction\n" + b"".join(
+    f"{i},{i % 12 + 1:02d}/01,+{i}\n".encode() for i in range(10_000)
+)
+
+
+def test__lambda_handler__concurrent_vs_sequential(lambda_app, monkeypatch):
+    # Arrange
+    keys = [f"tx_file_{i}.csv" for i in range(N_RECORDS)]
+    lambda_app.get_client("s3").objects = {("bucket", key): TX_FILE for key in keys}
+    lambda_app.get_client("s3").latency = S3_LATENCY
+    event = build_s3_event("bucket", keys)
+    elapsed = {}
+
+    # Act
+    for max_workers in (1, 8):
+        monkeypatch.setattr(lambda_app, "MAX_WORKERS", max_workers)
+        start = time.perf_counter()
+        response = lambda_app.lambda_handler(event, None)
+        elapsed[max_workers] = time.perf_counter() - start
+        assert response["batchItemFailures"] == []
+
+    # Assert
+    print(
+        f"\nSequential: {elapsed[1]:.2f}s, 8 workers: {elapsed[8]:.2f}s "
+        f"for {N_RECORDS} records"
+    )
+    assert elapsed[8] < elapsed[1]
@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+
+MEASURE_PEAK_RSS = """
+import resource
+import sys
+import uuid
+
+from handlers import InMemoryReportHandler
+from readers import FileReader
+
+handler = InMemoryReportHandler()
+file_id = uuid.uuid4()
+for batch in FileReader(sys.argv[1]).batches():
+    handler.load_batch(batch, file_id)
+handler.calculate(file_id)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+# Peak RSS may grow a little because of allocator noise, never with the size.
+MAX_PEAK_RSS_GROWTH_KB = 16 * 1024
+
+
+def write_transaction_file(filepath: str, n_rows: int) -> None:
+    block_size = 10_000
+    block = "".join(
+        f"{i},{i % 12 + 1:02d}/{i % 28 + 1:02d},{'+' if i % 2 else '-'}{i % 200}\n"
+        for i in range(block_size)
+    )
+    with open(filepath, "w") as file:
+        file.write("Id,Date,Transaction\n")
+        for _ in range(n_rows // block_size):
+            file.write(block)
+
+
+def measure_peak_rss(filepath: str) -> int:
+    output = subprocess.check_output(
+        [sys.executable, "-c", MEASURE_PEAK_RSS, filepath],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    return int(output)
+
+
+def test__read__peak_rss_should_not_depend_on_file_size(tmp_path):
+    # Arrange
+    small_file = str(tmp_path / "small.csv")
+    large_file = str(tmp_path / "large.csv")
+    write_transaction_file(small_file, 10_000)
+    write_transaction_file(large_file, 10_000_000)
+
+    # Act
+    small_peak_rss = measure_peak_rss(small_file)
+    large_peak_rss = measure_peak_rss(large_file)
+
+    # Assert
+    assert large_peak_rss - small_peak_rss < MAX_PEAK_RSS_GROWTH_KB
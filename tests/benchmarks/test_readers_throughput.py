@@ -0,0 +1,49 @@
+import contextlib
+import os
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from commands.create_tx_file import create_tx_file
+from readers import FileReader, MmapFileReader
+
+# create_tx_file is limited to 9999 transactions of each type per file.
+N_COPIES = 100
+
+
+@pytest.fixture(scope="module")
+def transaction_file(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("readers")
+    with contextlib.chdir(directory):
+        os.mkdir("tx_files")
+        CliRunner().invoke(
+            create_tx_file,
+            ["--filename", "tx_file.csv", "--n_credit", 9999, "--n_debit", 9999],
+        )
+        with open("tx_files/tx_file.csv", "rb") as file:
+            header = file.readline()
+            lines = file.read()
+
+    filepath = str(directory / "tx_files" / "large_tx_file.csv")
+    with open(filepath, "wb") as file:
+        file.write(header)
+        for _ in range(N_COPIES):
+            file.write(lines)
+    return filepath
+
+
+@pytest.mark.parametrize("reader_class", [FileReader, MmapFileReader])
+def test__batches__megabytes_per_second(transaction_file, reader_class):
+    # Arrange
+    reader = reader_class(transaction_file)
+
+    # Act
+    start = time.perf_counter()
+    n_rows = sum(len(batch.ids) for batch in reader.batches())
+    elapsed = time.perf_counter() - start
+
+    # Assert
+    megabytes_per_second = reader.bytes_processed / elapsed / 1024**2
+    print(f"\n{reader_class.__name__}: {megabytes_per_second:,.1f} MB/sec")
+    assert n_rows == 19998 * N_COPIES
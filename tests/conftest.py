@@ -1,12 +1,17 @@
+import importlib
 import os
+import sys
 
+import boto3
 import pytest
 import sqlalchemy.engine.url
 from pytest_postgresql.janitor import DatabaseJanitor
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from config import get_client
 from db import Base
+from tests.fakes import FakeEmail, FakeS3Client, FakeSSMClient
 
 DATABASE_URL = os.getenv("TEST_DATABASE_URL")
 
@@ -59,3 +64,29 @@ def session(database, tables):
     session.close()
     transaction.rollback()
     connection.close()
+
+
+@pytest.fixture
+def lambda_app(monkeypatch):
+    """
+    Import the Lambda module using fake AWS clients and a fake email service.
+    """
+    clients = {
+        "s3": FakeS3Client({}),
+        "ssm": FakeSSMClient(
+            {"sender-parameter": "sender@example.com", "password-parameter": "1234"}
+        ),
+    }
+    monkeypatch.setattr(boto3, "client", lambda service, **kwargs: clients[service])
+    monkeypatch.setenv("EMAIL_SENDER", "sender-parameter")
+    monkeypatch.setenv("EMAIL_PASSWORD", "password-parameter")
+    monkeypatch.setenv("EMAIL_RECEIVER", "receiver@example.com")
+    monkeypatch.setattr(FakeEmail, "outbox", [])
+    get_client.cache_clear()
+
+    monkeypatch.delitem(sys.modules, "lambda_app", raising=False)
+    module = importlib.import_module("lambda_app")
+    monkeypatch.setattr(module, "Email", FakeEmail)
+    yield module
+    sys.modules.pop("lambda_app", None)
+    get_client.cache_clear()
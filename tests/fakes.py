@@ -0,0 +1,51 @@
+import io
+import time
+
+from botocore.response import StreamingBody
+
+from emails import Email
+
+
+class FakeS3Client:
+    def __init__(self, objects: dict[tuple[str, str], bytes], latency: float = 0):
+        self.objects = objects
+        self.latency = latency
+
+    def get_object(self, Bucket: str, Key: str) -> dict:
+        time.sleep(self.latency)
+        content = self.objects[(Bucket, Key)]
+        return {"Body": StreamingBody(io.BytesIO(content), len(content))}
+
+
+class FakeSSMClient:
+    def __init__(self, parameters: dict[str, str]) -> None:
+        self.parameters = parameters
+        self.n_calls = 0
+
+    def get_parameters(self, Names: list[str], WithDecryption: bool) -> dict:
+        self.n_calls += 1
+        return {
+            "Parameters": [
+                {"Name": name, "Value": self.parameters[name]}
+                for name in Names
+                if name in self.parameters
+            ],
+            "InvalidParameters": [
+                name for name in Names if name not in self.parameters
+            ],
+        }
+
+
+class FakeEmail(Email):
+    outbox: list[tuple[str, str, list[str]]] = []
+
+    def send(self, subject: str, body: str, receivers: list[str]) -> None:
+        self.outbox.append((subject, body, receivers))
+
+
+def build_s3_event(bucket: str, keys: list[str]) -> dict:
+    return {
+        "Records": [
+            {"s3": {"bucket": {"name": bucket}, "object": {"key": key}}} for key in keys
+        ]
+    }
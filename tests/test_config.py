@@ -0,0 +1,56 @@
+import pytest
+
+from config import SSMParameters
+from tests.fakes import FakeSSMClient
+
+
+class TestSSMParameters:
+    def test__values__should_fetch_every_parameter_in_one_call(self):
+        # Arrange
+        client = FakeSSMClient({"/sender": "sender@example.com", "/password": "1"})
+        parameters = SSMParameters(
+            {"EMAIL_SENDER": "/sender", "EMAIL_PASSWORD": "/password"}, client=client
+        )
+
+        # Act
+        values = parameters.values()
+
+        # Assert
+        assert values == {"EMAIL_SENDER": "sender@example.com", "EMAIL_PASSWORD": "1"}
+        assert client.n_calls == 1
+
+    def test__get__should_use_the_cache_until_it_expires(self):
+        # Arrange
+        client = FakeSSMClient({"/sender": "sender@example.com"})
+        parameters = SSMParameters({"EMAIL_SENDER": "/sender"}, client=client)
+
+        # Act
+        parameters.get("EMAIL_SENDER")
+        parameters.get("EMAIL_SENDER")
+
+        # Assert
+        assert client.n_calls == 1
+
+    def test__get__should_fetch_again_when_the_cache_expires(self):
+        # Arrange
+        client = FakeSSMClient({"/sender": "sender@example.com"})
+        parameters = SSMParameters({"EMAIL_SENDER": "/sender"}, ttl=0, client=client)
+        parameters.get("EMAIL_SENDER")
+        client.parameters["/sender"] = "new-sender@example.com"
+
+        # Act
+        value = parameters.get("EMAIL_SENDER")
+
+        # Assert
+        assert value == "new-sender@example.com"
+        assert client.n_calls == 2
+
+    def test__get__should_raise_for_missing_parameters(self):
+        # Arrange
+        parameters = SSMParameters(
+            {"EMAIL_SENDER": "/sender"}, client=FakeSSMClient({})
+        )
+
+        # Act / Assert
+        with pytest.raises(KeyError):
+            parameters.get("EMAIL_SENDER")
@@ -0,0 +1,146 @@
+import smtplib
+import socket
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+from emails import Email, SMTPConnectionPool
+
+
+class RecordingHandler:
+    def __init__(self) -> None:
+        self.envelopes = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.envelopes.append(envelope)
+        return "250 Message accepted for delivery"
+
+
+def authenticate(server, session, envelope, mechanism, auth_data):
+    return AuthResult(success=auth_data.password == b"1234")
+
+
+def find_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    controller = Controller(
+        RecordingHandler(),
+        hostname="127.0.0.1",
+        port=find_free_port(),
+        authenticator=authenticate,
+        auth_require_tls=False,
+    )
+    controller.start()
+    yield controller
+    controller.stop()
+
+
+@pytest.fixture
+def pool(smtp_server):
+    pool = SMTPConnectionPool(
+        "sender@example.com",
+        "1234",
+        host=smtp_server.hostname,
+        port=smtp_server.port,
+        use_ssl=False,
+    )
+    yield pool
+    pool.close()
+
+
+class TestEmail:
+    def test__send_many__should_use_one_connection(self, smtp_server, pool):
+        # Arrange
+        email = Email("sender@example.com", "1234", pool=pool)
+        emails = [
+            (f"Report {i}", "<p>Report</p>", [f"receiver{i}@example.com"])
+            for i in range(5)
+        ]
+
+        # Act
+        email.send_many(emails)
+
+        # Assert
+        envelopes = smtp_server.handler.envelopes
+        assert [envelope.rcpt_tos for envelope in envelopes] == [
+            [f"receiver{i}@example.com"] for i in range(5)
+        ]
+        assert b"Subject: Report 0" in envelopes[0].content
+        assert pool.n_connections_opened == 1
+
+    def test__send__should_reuse_the_connection(self, smtp_server, pool):
+        # Arrange
+        email = Email("sender@example.com", "1234", pool=pool)
+
+        # Act
+        email.send("Report", "<p>Report</p>", ["receiver@example.com"])
+        email.send("Report", "<p>Report</p>", ["receiver@example.com"])
+
+        # Assert
+        assert len(smtp_server.handler.envelopes) == 2
+        assert pool.n_connections_opened == 1
+
+
+class TestSMTPConnectionPool:
+    def test__send_many__should_reconnect_when_server_disconnects(
+        self, smtp_server, pool
+    ):
+        # Arrange
+        pool.send_many([(["receiver@example.com"], "Subject: 1\n\n1")])
+        smtp_server.stop()
+        smtp_server.start()
+
+        # Act
+        pool.send_many([(["receiver@example.com"], "Subject: 2\n\n2")])
+
+        # Assert
+        assert len(smtp_server.handler.envelopes) == 2
+        assert pool.n_connections_opened == 2
+
+    def test__connection__should_close_idle_connections(self, smtp_server, pool):
+        # Arrange
+        pool.idle_timeout = 0
+        pool.send_many([(["receiver@example.com"], "Subject: 1\n\n1")])
+
+        # Act
+        pool.send_many([(["receiver@example.com"], "Subject: 2\n\n2")])
+
+        # Assert
+        assert pool.n_connections_opened == 2
+
+    def test__connection__should_check_health_of_idle_connections(
+        self, smtp_server, pool
+    ):
+        # Arrange
+        pool.health_check_after = 0
+        pool.send_many([(["receiver@example.com"], "Subject: 1\n\n1")])
+        smtp_server.stop()
+        smtp_server.start()
+
+        # Act
+        with pool.connection() as connection:
+            status, _ = connection.noop()
+
+        # Assert
+        assert status == 250
+        assert pool.n_connections_opened == 2
+
+    def test__connect__should_fail_with_wrong_password(self, smtp_server):
+        # Arrange
+        pool = SMTPConnectionPool(
+            "sender@example.com",
+            "wrong",
+            host=smtp_server.hostname,
+            port=smtp_server.port,
+            use_ssl=False,
+        )
+
+        # Act / Assert
+        with pytest.raises(smtplib.SMTPAuthenticationError):
+            pool.send_many([(["receiver@example.com"], "Subject: 1\n\n1")])
@@ -4,8 +4,9 @@ from decimal import Decimal
 
 from commands.create_tx_file import Transaction
 from db import Transaction as TransactionModel
-from handlers import InMemoryReportHandler, SQLReportHandler
+from handlers import CentsReportHandler, InMemoryReportHandler, SQLReportHandler
 from models import ReportInformationPerMonth
+from parsers import parse_batch
 
 
 def create_transaction(**kwargs) -> Transaction:
@@ -147,6 +148,23 @@ class TestInMemoryHandler:
         ]
         assert result.information_per_month == expected_result
 
+    def test__load_batch__should_match_load(self):
+        # Arrange
+        lines = ["1,01/05,+10.5\n", "2,12/31,-20\n", "3,01/07,-1.25\n"]
+        handler = InMemoryReportHandler()
+        batch_handler = InMemoryReportHandler()
+        file_id = retrieve_file_id()
+        for line in lines:
+            handler.load(Transaction.from_csv(line), file_id)
+
+        # Act
+        batch_handler.load_batch(parse_batch("".join(lines).encode()), file_id)
+
+        # Assert
+        assert repr(batch_handler.calculate(file_id)) == repr(
+            handler.calculate(file_id)
+        )
+
     def test__safe_division__should_return_zero(self):
         # Arrange
         handler = InMemoryReportHandler()
@@ -159,18 +177,99 @@ class TestInMemoryHandler:
         assert result.average_credit == Decimal("0")
 
 
+class TestCentsReportHandler:
+    def test__load__should_increase_credit_counters(self):
+        # Arrange
+        handler = CentsReportHandler()
+        transaction = create_transaction(amount=Decimal("10.25"))
+
+        # Act
+        handler.load(transaction, retrieve_file_id())
+
+        # Assert
+        assert handler.totals[CentsReportHandler.N_CREDIT] == 1
+        assert handler.totals[CentsReportHandler.SUM_CREDIT] == 1025
+        assert handler.scale == 2
+
+    def test__load__should_increase_debit_counters(self):
+        # Arrange
+        handler = CentsReportHandler()
+        transaction = create_transaction(
+            is_credit=False, date=convert_str_to_date("12/01")
+        )
+
+        # Act
+        handler.load(transaction, retrieve_file_id())
+
+        # Assert
+        assert handler.totals[11 * 4 + CentsReportHandler.N_DEBIT] == 1
+        assert handler.totals[11 * 4 + CentsReportHandler.SUM_DEBIT] == 1000
+
+    def test__calculate__should_match_in_memory_handler(self):
+        # Arrange
+        lines = [
+            "1,03/05,+10.5\n",
+            "2,01/31,-20\n",
+            "3,03/07,-1.25\n",
+            "4,01/07,+7\n",
+        ]
+        handler = CentsReportHandler()
+        in_memory_handler = InMemoryReportHandler()
+        file_id = retrieve_file_id()
+        batch = parse_batch("".join(lines).encode())
+        in_memory_handler.load_batch(batch, file_id)
+
+        # Act
+        handler.load_batch(batch, file_id)
+
+        # Assert
+        assert repr(handler.calculate(file_id)) == repr(
+            in_memory_handler.calculate(file_id)
+        )
+
+    def test__safe_division__should_return_zero(self):
+        # Arrange
+        handler = CentsReportHandler()
+        file_id = retrieve_file_id()
+
+        # Act
+        result = handler.calculate(file_id)
+
+        # Assert
+        assert result.average_credit == Decimal("0")
+        assert result.balance == Decimal("0")
+
+
 class TestSQLReportHandler:
     def test__load__store_transaction(self, session):
         # Arrange
         handler = SQLReportHandler(session)
         transaction = create_transaction()
 
+        file_id = retrieve_file_id()
+
         # Act
-        handler.load(transaction, retrieve_file_id())
+        handler.load(transaction, file_id)
+        handler.finish(file_id)
 
         # Assert
         assert session.query(TransactionModel).count() == 1
 
+    def test__load__should_buffer_until_batch_is_full(self, session):
+        # Arrange
+        handler = SQLReportHandler(session, batch_size=2)
+        file_id = retrieve_file_id()
+
+        # Act
+        handler.load(create_transaction(), file_id)
+        n_rows_before_batch_is_full = session.query(TransactionModel).count()
+        handler.load(create_transaction(id=1), file_id)
+
+        # Assert
+        assert n_rows_before_batch_is_full == 0
+        assert session.query(TransactionModel).count() == 2
+        assert handler.pending == []
+
     def test__calculate__should_return_total(self, session):
         # Arrange
         handler = SQLReportHandler(session)
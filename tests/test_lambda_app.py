@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+
+from tests.fakes import FakeEmail, build_s3_event
+
+TX_FILE = b"Id,Date,Transaction\n1,01/05,+10\n2,02/01,-20.5\n"
+
+
+class TestLambdaHandler:
+    def test__lambda_handler__should_send_a_report_per_record(self, lambda_app):
+        # Arrange
+        lambda_app.get_client("s3").objects = {
+            ("bucket", "first.csv"): TX_FILE,
+            ("bucket", "second file.csv"): TX_FILE,
+        }
+        event = build_s3_event("bucket", ["first.csv", "second+file.csv"])
+
+        # Act
+        response = lambda_app.lambda_handler(event, None)
+
+        # Assert
+        assert response["batchItemFailures"] == []
+        assert len(FakeEmail.outbox) == 2
+        assert FakeEmail.outbox[0][2] == ["receiver@example.com"]
+
+    def test__lambda_handler__should_report_failed_records(self, lambda_app):
+        # Arrange
+        lambda_app.get_client("s3").objects = {("bucket", "first.csv"): TX_FILE}
+        event = build_s3_event("bucket", ["first.csv", "missing.csv"])
+
+        # Act
+        response = lambda_app.lambda_handler(event, None)
+
+        # Assert
+        assert response["batchItemFailures"] == [
+            {"itemIdentifier": "bucket/missing.csv"}
+        ]
+        assert len(FakeEmail.outbox) == 1
+
+    def test__lambda_handler__should_fetch_secrets_once(self, lambda_app):
+        # Arrange
+        lambda_app.get_client("s3").objects = {("bucket", "first.csv"): TX_FILE}
+        event = build_s3_event("bucket", ["first.csv"])
+
+        # Act
+        lambda_app.lambda_handler(event, None)
+        lambda_app.lambda_handler(event, None)
+
+        # Assert
+        assert lambda_app.get_client("ssm").n_calls == 1
+
+
+def test__import__should_not_load_aws_nor_database_modules():
+    # Arrange
+    code = (
+        "import sys, lambda_app; "
+        "print(sorted({'boto3', 'sqlalchemy', 'click'} & set(sys.modules)))"
+    )
+
+    # Act
+    output = subprocess.check_output(
+        [sys.executable, "-c", code],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+
+    # Assert
+    assert output.decode().strip() == "[]"
@@ -0,0 +1,63 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from models import Transaction
+from parsers import cents_to_decimal, iter_transactions, parse_batch
+
+
+class TestParseBatch:
+    def test__parse_batch__should_return_columns(self):
+        # Arrange
+        chunk = b"1,01/05,+10.5\n2,12/31,-20\n"
+
+        # Act
+        batch = parse_batch(chunk)
+
+        # Assert
+        assert list(batch.ids) == [1, 2]
+        assert list(batch.months) == [1, 12]
+        assert list(batch.days) == [5, 31]
+        assert list(batch.amounts) == [1050, 2000]
+        assert list(batch.is_credit) == [1, 0]
+        assert batch.scale == 1
+
+    def test__parse_batch__should_ignore_crlf_and_blank_lines(self):
+        # Arrange
+        chunk = b"1,01/05,+10\r\n\r\n2,02/29,-20\r\n"
+
+        # Act
+        batch = parse_batch(chunk)
+
+        # Assert
+        assert list(batch.ids) == [1, 2]
+        assert list(batch.months) == [1, 2]
+
+    def test__parse_batch__should_parse_dates_without_padding(self):
+        # Act
+        batch = parse_batch(b"1,1/5,+10\n")
+
+        # Assert
+        assert (batch.months[0], batch.days[0]) == (1, 5)
+
+    def test__parse_batch__should_reject_sub_cent_amounts(self):
+        with pytest.raises(ValueError):
+            parse_batch(b"1,01/05,+10.125\n")
+
+    def test__iter_transactions__should_match_from_csv(self):
+        # Arrange
+        lines = ["1,01/05,+10.5\n", "2,12/31,-20.25\n"]
+        batch = parse_batch("".join(lines).encode())
+
+        # Act
+        transactions = list(iter_transactions(batch))
+
+        # Assert
+        assert transactions == [Transaction.from_csv(line) for line in lines]
+        assert transactions[0].date == datetime(1900, 1, 5)
+
+
+def test__cents_to_decimal__should_keep_scale():
+    assert repr(cents_to_decimal(1000, 0)) == repr(Decimal("10"))
+    assert repr(cents_to_decimal(1050, 2)) == repr(Decimal("10.50"))
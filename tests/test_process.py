@@ -0,0 +1,78 @@
+from functools import partial
+
+import pytest
+
+import process
+from handlers import CentsReportHandler, InMemoryReportHandler
+from models import GenerateReportCommand
+from notifications import Notification
+from readers import MmapFileReader, split_file
+
+
+class FakeNotification(Notification):
+    def __init__(self) -> None:
+        self.report_result = None
+        self.receivers = None
+
+    def send(self, report_result, receivers: list[str]) -> None:
+        self.report_result = report_result
+        self.receivers = receivers
+
+
+@pytest.fixture
+def command(tmp_path):
+    filepath = tmp_path / "tx_file.csv"
+    filepath.write_text(
+        "Id,Date,Transaction\n"
+        + "".join(
+            f"{i},{i % 12 + 1:02d}/{i % 28 + 1:02d},{'+' if i % 3 else '-'}{i}.5\n"
+            for i in range(500)
+        )
+    )
+    return GenerateReportCommand(str(filepath), "test@example.com")
+
+
+class TestProcessTransactionFile:
+    def test__should_use_the_given_reader(self, command):
+        # Arrange
+        notification = FakeNotification()
+        mmap_notification = FakeNotification()
+        process.process_transaction_file(InMemoryReportHandler(), notification, command)
+
+        # Act
+        process.process_transaction_file(
+            InMemoryReportHandler(),
+            mmap_notification,
+            command,
+            reader=MmapFileReader(command.filepath, chunk_size=64),
+        )
+
+        # Assert
+        assert repr(mmap_notification.report_result) == repr(notification.report_result)
+
+
+class TestProcessTransactionFileInParallel:
+    @pytest.mark.parametrize(
+        "handler_class", [InMemoryReportHandler, CentsReportHandler]
+    )
+    def test__should_match_sequential_processing(
+        self, monkeypatch, command, handler_class
+    ):
+        # Arrange
+        monkeypatch.setattr(process, "split_file", partial(split_file, min_part_size=1))
+        sequential_notification = FakeNotification()
+        parallel_notification = FakeNotification()
+        process.process_transaction_file(
+            InMemoryReportHandler(), sequential_notification, command
+        )
+
+        # Act
+        process.process_transaction_file_in_parallel(
+            handler_class(), parallel_notification, command, workers=4
+        )
+
+        # Assert
+        assert repr(parallel_notification.report_result) == repr(
+            sequential_notification.report_result
+        )
+        assert parallel_notification.receivers == ["test@example.com"]
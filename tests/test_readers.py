@@ -0,0 +1,175 @@
+import threading
+
+import pytest
+
+from readers import FileReader, MmapFileReader, S3Reader, prefetch, split_file
+from tests.fakes import FakeS3Client
+
+CONTENT = b"Id,Date,Transaction\r\n1,01/05,+10\r\n\r\n2,02/01,-20.5\r\n3,03/01,+1"
+
+
+@pytest.fixture
+def transaction_file(tmp_path):
+    filepath = tmp_path / "tx_file.csv"
+    filepath.write_bytes(CONTENT)
+    return str(filepath)
+
+
+class TestFileReader:
+    @pytest.mark.parametrize("buffer_size", [1, 3, 7, 1024])
+    def test__iter__should_yield_whole_lines(self, transaction_file, buffer_size):
+        # Arrange
+        reader = FileReader(transaction_file, buffer_size=buffer_size)
+
+        # Act
+        content = b"".join(reader)
+
+        # Assert
+        assert content == CONTENT[CONTENT.index(b"\n") + 1 :]
+
+    def test__iter__should_count_bytes_processed(self, transaction_file):
+        # Arrange
+        reader = FileReader(transaction_file, buffer_size=4)
+
+        # Act
+        list(reader)
+
+        # Assert
+        assert reader.bytes_processed == len(CONTENT)
+
+    def test__batches__should_skip_blank_lines(self, transaction_file):
+        # Arrange
+        reader = FileReader(transaction_file, buffer_size=5)
+
+        # Act
+        ids = [id for batch in reader.batches() for id in batch.ids]
+
+        # Assert
+        assert ids == [1, 2, 3]
+
+    def test__iter__should_not_yield_header_only_file(self, tmp_path):
+        # Arrange
+        filepath = tmp_path / "empty.csv"
+        filepath.write_bytes(b"Id,Date,Transaction\n")
+
+        # Act
+        chunks = list(FileReader(str(filepath)))
+
+        # Assert
+        assert chunks == []
+
+
+class TestMmapFileReader:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+    def test__iter__should_yield_whole_lines(self, transaction_file, chunk_size):
+        # Arrange
+        reader = MmapFileReader(transaction_file, chunk_size=chunk_size)
+
+        # Act
+        chunks = list(reader)
+
+        # Assert
+        assert all(isinstance(chunk, memoryview) for chunk in chunks)
+        assert b"".join(chunks) == CONTENT[CONTENT.index(b"\n") + 1 :]
+        assert reader.bytes_processed == len(CONTENT)
+
+    def test__batches__should_skip_blank_lines(self, transaction_file):
+        # Arrange
+        reader = MmapFileReader(transaction_file, chunk_size=5)
+
+        # Act
+        ids = [id for batch in reader.batches() for id in batch.ids]
+
+        # Assert
+        assert ids == [1, 2, 3]
+
+    @pytest.mark.parametrize("content", [b"", b"Id,Date,Transaction"])
+    def test__iter__should_not_yield_without_transactions(self, tmp_path, content):
+        # Arrange
+        filepath = tmp_path / "empty.csv"
+        filepath.write_bytes(content)
+
+        # Act
+        chunks = list(MmapFileReader(str(filepath)))
+
+        # Assert
+        assert chunks == []
+
+
+class TestS3Reader:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+    def test__iter__should_stream_the_object(self, chunk_size):
+        # Arrange
+        client = FakeS3Client({("bucket", "tx_file.csv"): CONTENT})
+        reader = S3Reader(client, "bucket", "tx_file.csv", chunk_size=chunk_size)
+
+        # Act
+        content = b"".join(reader)
+
+        # Assert
+        assert content == CONTENT[CONTENT.index(b"\n") + 1 :]
+        assert reader.bytes_processed == len(CONTENT)
+
+
+class TestPrefetch:
+    def test__prefetch__should_yield_every_buffer(self):
+        assert list(prefetch(iter([b"a", b"b", b"c"]), 1)) == [b"a", b"b", b"c"]
+
+    def test__prefetch__should_raise_producer_errors(self):
+        # Arrange
+        def buffers():
+            yield b"a"
+            raise OSError("connection reset")
+
+        # Act / Assert
+        with pytest.raises(OSError):
+            list(prefetch(buffers(), 1))
+
+    def test__prefetch__should_stop_producer_when_closed(self):
+        # Arrange
+        n_threads = threading.active_count()
+        buffers = prefetch((b"a" for _ in range(100)), 1)
+        next(buffers)
+
+        # Act
+        buffers.close()
+
+        # Assert
+        assert threading.active_count() == n_threads
+
+
+class TestSplitFile:
+    @pytest.mark.parametrize("n_parts", [1, 2, 3, 10])
+    def test__split_file__should_align_ranges_on_lines(self, transaction_file, n_parts):
+        # Act
+        ranges = split_file(transaction_file, n_parts, min_part_size=1)
+
+        # Assert
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(CONTENT)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+            assert CONTENT[start - 1 : start] == b"\n"
+        assert all(start < end for start, end in ranges)
+
+    def test__split_file__should_read_every_line_once(self, transaction_file):
+        # Arrange
+        ranges = split_file(transaction_file, 3, min_part_size=1)
+
+        # Act
+        ids = [
+            id
+            for start, end in ranges
+            for batch in FileReader(transaction_file, start=start, end=end).batches()
+            for id in batch.ids
+        ]
+
+        # Assert
+        assert ids == [1, 2, 3]
+
+    def test__split_file__should_not_split_small_files(self, transaction_file):
+        # Act
+        ranges = split_file(transaction_file, 4)
+
+        # Assert
+        assert ranges == [(0, len(CONTENT))]
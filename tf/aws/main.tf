@@ -88,14 +88,14 @@ resource "aws_iam_policy" "custom_policy" {
     Statement = [
       {
         Action = [
-          "ssm:GetParameter",
+          "ssm:GetParameters",
         ]
         Effect   = "Allow"
         Resource = aws_ssm_parameter.email_sender.arn
       },
       {
         Action = [
-          "ssm:GetParameter",
+          "ssm:GetParameters",
         ]
         Effect   = "Allow"
         Resource = aws_ssm_parameter.email_password.arn